@@ -137,6 +137,10 @@ AWS_STORAGE_BUCKET_NAME = R2_BUCKET_NAME
 AWS_S3_REGION_NAME = R2_REGION
 AWS_S3_ENDPOINT_URL = R2_ENDPOINT
 
+# Public base URL of the bucket (R2 public bucket or custom domain). When set,
+# uploads return plain URLs under it instead of presigned ones.
+S3_PUBLIC_URL_BASE = os.getenv('S3_PUBLIC_URL_BASE', '').rstrip('/')
+
 # Firecrawl Configuration
 FIRECRAWL_API_KEY = os.getenv('FIRECRAWL_API_KEY')
 SCRAPING_PROVIDER = os.getenv('SCRAPING_PROVIDER', 'firecrawl')  # 'firecrawl' or 'beautifulsoup'
@@ -153,6 +157,14 @@ CELERY_ACCEPT_CONTENT = ['json']
 CELERY_TASK_SERIALIZER = 'json'
 CELERY_RESULT_SERIALIZER = 'json'
 CELERY_TIMEZONE = TIME_ZONE
+# Analyses are long-running; take one task at a time so work spreads across workers
+CELERY_WORKER_PREFETCH_MULTIPLIER = 1
+# Cap how fast training generation (several LLM calls each) starts per worker
+CELERY_TASK_ANNOTATIONS = {
+    'domain_intelligence.tasks.generate_sales_training_modules': {
+        'rate_limit': os.getenv('LLM_TASK_RATE_LIMIT', '10/m'),
+    },
+}
 
 # Scraping Configuration
 SCRAPING_TIMEOUT = int(os.getenv('SCRAPING_TIMEOUT', 30))
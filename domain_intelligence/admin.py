@@ -1,13 +1,49 @@
 from django.contrib import admin
+from django.core.paginator import Paginator
+from django.db import connections
+from django.utils.functional import cached_property
 from .models import DomainAnalysis, SalesTraining, ScrapingLog
 
 
+class FasterAdminPaginator(Paginator):
+    """
+    Paginator that skips COUNT(*) on unfiltered changelists
+
+    On PostgreSQL the planner's row estimate from pg_class is used instead.
+    Filtered querysets, small tables and other backends use the exact count.
+    """
+
+    ESTIMATE_THRESHOLD = 10000
+
+    @cached_property
+    def count(self):
+        queryset = self.object_list
+        connection = connections[queryset.db]
+
+        if queryset.query.where or connection.vendor != 'postgresql':
+            return super().count
+
+        with connection.cursor() as cursor:
+            cursor.execute(
+                "SELECT reltuples FROM pg_class WHERE relname = %s",
+                [queryset.model._meta.db_table]
+            )
+            row = cursor.fetchone()
+
+        estimate = int(row[0]) if row else 0
+        if estimate < self.ESTIMATE_THRESHOLD:
+            return super().count
+        return estimate
+
+
 @admin.register(DomainAnalysis)
 class DomainAnalysisAdmin(admin.ModelAdmin):
     list_display = ['domain_name', 'status', 'created_at', 'completed_at']
     list_filter = ['status', 'created_at']
     search_fields = ['domain_name']
     readonly_fields = ['created_at', 'updated_at', 'completed_at']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
     fieldsets = (
         ('Domain Information', {
@@ -31,6 +67,9 @@ class SalesTrainingAdmin(admin.ModelAdmin):
     list_filter = ['training_type', 'difficulty_level', 'created_at']
     search_fields = ['title', 'domain_analysis__domain_name']
     readonly_fields = ['created_at', 'updated_at']
+    list_select_related = ['domain_analysis']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
 
 
 @admin.register(ScrapingLog)
@@ -39,3 +78,6 @@ class ScrapingLogAdmin(admin.ModelAdmin):
     list_filter = ['success', 'created_at']
     search_fields = ['url', 'domain_analysis__domain_name']
     readonly_fields = ['created_at']
+    list_select_related = ['domain_analysis']
+    paginator = FasterAdminPaginator
+    show_full_result_count = False
@@ -0,0 +1,44 @@
+"""
+Model fields used by domain intelligence models
+"""
+import json
+import orjson
+from django.db import models
+
+
+class OrjsonEncoder(json.JSONEncoder):
+    """JSON encoder that delegates to orjson (used via json.dumps(cls=...))"""
+
+    OPTIONS = orjson.OPT_NAIVE_UTC | orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY
+
+    def encode(self, o):
+        return orjson.dumps(o, option=self.OPTIONS).decode()
+
+
+class OrjsonDecoder(json.JSONDecoder):
+    """JSON decoder that delegates to orjson (used via json.loads(cls=...))"""
+
+    def decode(self, s, *args, **kwargs):
+        return orjson.loads(s)
+
+
+class OrjsonField(models.JSONField):
+    """
+    JSONField that serializes with orjson
+
+    Django passes the encoder/decoder to json.dumps/json.loads on every backend,
+    so swapping them in keeps the regular JSONField lookups and adaptation intact.
+    """
+
+    def __init__(self, *args, **kwargs):
+        kwargs.setdefault('encoder', OrjsonEncoder)
+        kwargs.setdefault('decoder', OrjsonDecoder)
+        super().__init__(*args, **kwargs)
+
+    def deconstruct(self):
+        name, path, args, kwargs = super().deconstruct()
+        if kwargs.get('encoder') is OrjsonEncoder:
+            del kwargs['encoder']
+        if kwargs.get('decoder') is OrjsonDecoder:
+            del kwargs['decoder']
+        return name, path, args, kwargs
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:37
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain_intelligence', '0001_initial'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='domainanalysis',
+            index=models.Index(fields=['status', '-created_at'], name='da_status_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='salestraining',
+            index=models.Index(fields=['domain_analysis', '-created_at'], name='st_analysis_created_idx'),
+        ),
+        migrations.AddIndex(
+            model_name='scrapinglog',
+            index=models.Index(fields=['domain_analysis', '-created_at'], name='sl_analysis_created_idx'),
+        ),
+    ]
@@ -0,0 +1,17 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:39
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain_intelligence', '0002_composite_indexes'),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name='domainanalysis',
+            index=models.Index(condition=models.Q(('status__in', ['pending', 'scraping', 'analyzing'])), fields=['created_at'], name='da_active_idx'),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.18 on 2026-10-15 07:40
+
+import domain_intelligence.fields
+from django.db import migrations
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('domain_intelligence', '0003_active_analysis_index'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='domainanalysis',
+            name='business_intelligence',
+            field=domain_intelligence.fields.OrjsonField(blank=True, null=True),
+        ),
+        migrations.AlterField(
+            model_name='domainanalysis',
+            name='scraped_data',
+            field=domain_intelligence.fields.OrjsonField(blank=True, null=True),
+        ),
+    ]
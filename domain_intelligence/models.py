@@ -1,5 +1,6 @@
 from django.db import models
 from django.utils import timezone
+from .fields import OrjsonField
 
 
 class DomainAnalysis(models.Model):
@@ -17,11 +18,11 @@ class DomainAnalysis(models.Model):
     status = models.CharField(max_length=20, choices=STATUS_CHOICES, default='pending')
 
     # Scraped data
-    scraped_data = models.JSONField(null=True, blank=True)
+    scraped_data = OrjsonField(null=True, blank=True)
     scraped_at = models.DateTimeField(null=True, blank=True)
 
     # Business intelligence report
-    business_intelligence = models.JSONField(null=True, blank=True)
+    business_intelligence = OrjsonField(null=True, blank=True)
 
     # Files
     pdf_url = models.URLField(max_length=500, null=True, blank=True)
@@ -38,22 +39,47 @@ class DomainAnalysis(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Domain Analysis'
         verbose_name_plural = 'Domain Analyses'
+        indexes = [
+            models.Index(fields=['status', '-created_at'], name='da_status_created_idx'),
+            models.Index(
+                fields=['created_at'],
+                name='da_active_idx',
+                condition=models.Q(status__in=['pending', 'scraping', 'analyzing']),
+            ),
+        ]
 
     def __str__(self):
         return f"{self.domain_name} - {self.status}"
 
     def mark_completed(self):
-        """Mark analysis as completed"""
+        """Mark analysis as completed, saving the file URLs set on the instance"""
         self.status = 'completed'
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'completed_at', 'pdf_url', 'json_url', 'updated_at'])
 
     def mark_failed(self, error):
         """Mark analysis as failed"""
         self.status = 'failed'
         self.error_message = str(error)
         self.completed_at = timezone.now()
-        self.save()
+        self.save(update_fields=['status', 'error_message', 'completed_at', 'updated_at'])
+
+    @classmethod
+    def finish(cls, pk, error=None, **fields):
+        """
+        Mark analysis as completed (or failed if error is given) without loading it
+
+        Any extra keyword arguments (e.g. pdf_url) are written in the same UPDATE.
+        """
+        now = timezone.now()
+        fields.update({
+            'status': 'failed' if error else 'completed',
+            'completed_at': now,
+            'updated_at': now,
+        })
+        if error:
+            fields['error_message'] = str(error)
+        return cls.objects.filter(pk=pk).update(**fields)
 
 
 class SalesTraining(models.Model):
@@ -97,6 +123,9 @@ class SalesTraining(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Sales Training'
         verbose_name_plural = 'Sales Training Modules'
+        indexes = [
+            models.Index(fields=['domain_analysis', '-created_at'], name='st_analysis_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.title} - {self.training_type}"
@@ -123,6 +152,9 @@ class ScrapingLog(models.Model):
         ordering = ['-created_at']
         verbose_name = 'Scraping Log'
         verbose_name_plural = 'Scraping Logs'
+        indexes = [
+            models.Index(fields=['domain_analysis', '-created_at'], name='sl_analysis_created_idx'),
+        ]
 
     def __str__(self):
         return f"{self.url} - {'Success' if self.success else 'Failed'}"
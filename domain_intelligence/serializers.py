@@ -1,7 +1,35 @@
+import copy
+from django.db.models import Prefetch
 from rest_framework import serializers
 from .models import DomainAnalysis, SalesTraining, ScrapingLog
 
 
+_fields_cache = {}
+
+
+def cache_fields(serializer_class):
+    """
+    Build a ModelSerializer's fields once per class instead of per instance
+
+    Plain fields are shallow-copied on each instantiation; nested serializers
+    are deep-copied since binding mutates their child/parent chain.
+    """
+    build_fields = serializer_class.get_fields
+
+    def get_fields(self):
+        cls = type(self)
+        fields = _fields_cache.get(cls)
+        if fields is None:
+            fields = _fields_cache[cls] = build_fields(self)
+        return {
+            name: copy.deepcopy(field) if isinstance(field, serializers.BaseSerializer) else copy.copy(field)
+            for name, field in fields.items()
+        }
+
+    serializer_class.get_fields = get_fields
+    return serializer_class
+
+
 class DomainAnalysisRequestSerializer(serializers.Serializer):
     """Serializer for creating a new domain analysis"""
     domain_name = serializers.CharField(max_length=255, required=True)
@@ -50,6 +78,7 @@ class SalesTrainingSerializer(serializers.ModelSerializer):
         read_only_fields = ['id', 'created_at', 'updated_at']
 
 
+@cache_fields
 class DomainAnalysisSerializer(serializers.ModelSerializer):
     """Serializer for domain analysis model"""
     training_modules = SalesTrainingSerializer(many=True, read_only=True)
@@ -69,6 +98,24 @@ class DomainAnalysisSerializer(serializers.ModelSerializer):
             'updated_at', 'completed_at'
         ]
 
+    @classmethod
+    def setup_eager_loading(cls, queryset):
+        """Prefetch nested training modules and logs, loading only rendered columns"""
+        return queryset.prefetch_related(
+            Prefetch(
+                'training_modules',
+                queryset=SalesTraining.objects.only(
+                    *SalesTrainingSerializer.Meta.fields, 'domain_analysis_id'
+                )
+            ),
+            Prefetch(
+                'scraping_logs',
+                queryset=ScrapingLog.objects.only(
+                    *ScrapingLogSerializer.Meta.fields, 'domain_analysis_id'
+                )
+            ),
+        )
+
 
 class DomainAnalysisListSerializer(serializers.ModelSerializer):
     """Lightweight serializer for listing domain analyses"""
@@ -80,3 +127,14 @@ class DomainAnalysisListSerializer(serializers.ModelSerializer):
             'created_at', 'completed_at'
         ]
         read_only_fields = fields
+
+
+def serialize_domain_list(queryset):
+    """
+    Serialize analyses for the list endpoint straight from .values() rows
+
+    Skips model instantiation and DRF field machinery; datetimes are left to
+    the JSON renderer, which formats them the same way DateTimeField does.
+    The result is still a lazy queryset so it can be paginated.
+    """
+    return queryset.values(*DomainAnalysisListSerializer.Meta.fields)
@@ -1,10 +1,149 @@
 import logging
 import json
-from typing import Dict, Optional
+import re
+import threading
+import orjson
+from string import Template
+from typing import Dict, List, Optional
 from django.conf import settings
 
 logger = logging.getLogger(__name__)
 
+# Markdown code fence LLMs sometimes wrap JSON in (```json ... ``` or ``` ... ```)
+_FENCE_RE = re.compile(r"```(?:json)?\s*(.*?)\s*```", re.DOTALL)
+
+# Fields every BI report must carry, with the default used when the LLM omits one.
+# Container defaults are copied per response so reports never share them.
+_REQUIRED_DEFAULTS = {
+    'industry_overview': "No data available",
+    'market_size_and_trends': {},
+    'target_customer_segments': [],
+    'customer_pain_points': [],
+    'buying_behavior': {},
+    'top_competitors': [],
+    'common_objections': [],
+    'unique_selling_propositions': [],
+    'emerging_opportunities': [],
+    'recommended_strategies': [],
+    'ai_automation_opportunities': [],
+    'sales_team_challenges': [],
+    'sales_upskilling_recommendations': [],
+}
+
+# Static parts of the business intelligence prompt, built once at import time.
+# Only the per-domain slots are substituted on each call.
+_BI_PROMPT_TEMPLATE = Template("""You are a business intelligence and sales strategist AI.
+
+Given the domain: "$domain_name"
+
+Website Information:
+- Title: $title
+- Description: $description
+- Content Preview: $content
+
+Recent News & Market Context:
+$news_summary
+
+Industry Market Insights:
+$market_snippets
+
+LinkedIn: $linkedin_url (Found: $linkedin_found)
+
+""")
+
+_BI_SCHEMA_TAIL = """Generate a comprehensive structured business intelligence report including:
+
+1. Industry overview (2-3 paragraphs)
+2. Market size and growth trends (provide estimates with growth percentages)
+3. Target customer segments (3-5 key segments)
+4. Customer pain points (5-7 main pain points)
+5. Buying behavior (decision-making process, budget cycles, key influencers)
+6. Top competitors and their positioning (3-5 competitors with brief analysis)
+7. Common sales objections (5-7 objections with responses)
+8. Unique selling propositions (3-5 USPs)
+9. Emerging opportunities in next 3-5 years (4-6 opportunities)
+10. Recommended sales strategies (5-7 actionable strategies)
+11. AI-driven automation opportunities (4-6 specific opportunities)
+12. **Sales team challenges** - What challenges do sales people face when selling similar products/services? (5-7 specific challenges)
+13. **Sales upskilling recommendations** - What skills, training, and knowledge do sales teams need to succeed? (5-7 actionable upskilling areas with specific training suggestions)
+
+Output MUST be in valid JSON format following this exact structure:
+{
+  "industry_overview": "string",
+  "market_size_and_trends": {
+    "market_size": "string",
+    "growth_rate": "string",
+    "key_trends": "string"
+  },
+  "target_customer_segments": ["segment1", "segment2", ...],
+  "customer_pain_points": ["pain1", "pain2", ...],
+  "buying_behavior": {
+    "decision_process": "string",
+    "budget_cycle": "string",
+    "key_influencers": "string"
+  },
+  "top_competitors": [
+    {"name": "competitor1", "positioning": "string"},
+    ...
+  ],
+  "common_objections": [
+    {"objection": "string", "response": "string"},
+    ...
+  ],
+  "unique_selling_propositions": ["usp1", "usp2", ...],
+  "emerging_opportunities": ["opportunity1", "opportunity2", ...],
+  "recommended_strategies": ["strategy1", "strategy2", ...],
+  "ai_automation_opportunities": ["opportunity1", "opportunity2", ...],
+  "sales_team_challenges": [
+    {"challenge": "string", "impact": "string", "frequency": "string"},
+    ...
+  ],
+  "sales_upskilling_recommendations": [
+    {"skill_area": "string", "training_type": "string", "priority": "string", "expected_outcome": "string"},
+    ...
+  ]
+}
+
+Return ONLY valid JSON, no additional text."""
+
+
+# Shared by the single and batched training prompts
+_TRAINING_OUTLINE = """1. Learning objectives (3-5 clear objectives)
+2. Key concepts (main ideas salespeople need to understand)
+3. Practical scenarios (2-3 real-world scenarios)
+4. Practice exercises (interactive exercises)
+5. Assessment questions (5-7 questions to test understanding)
+6. Action items (specific steps to implement learning)"""
+
+_TRAINING_SCHEMA = """{
+  "learning_objectives": ["objective1", ...],
+  "key_concepts": ["concept1", ...],
+  "scenarios": [
+    {"situation": "string", "approach": "string", "outcome": "string"},
+    ...
+  ],
+  "exercises": ["exercise1", ...],
+  "assessment": [
+    {"question": "string", "correct_answer": "string", "explanation": "string"},
+    ...
+  ],
+  "action_items": ["action1", ...]
+}"""
+
+_GROQ_CLIENT = None
+_GROQ_LOCK = threading.Lock()
+
+
+def _get_client():
+    """Return the process-wide Groq client so its HTTP connection pool is reused"""
+    global _GROQ_CLIENT
+    if _GROQ_CLIENT is None:
+        with _GROQ_LOCK:
+            if _GROQ_CLIENT is None:
+                import groq
+                _GROQ_CLIENT = groq.Groq(api_key=settings.GROQ_API_KEY)
+    return _GROQ_CLIENT
+
 
 class LLMService:
     """Service for generating business intelligence using LLMs"""
@@ -12,10 +151,13 @@ class LLMService:
     def __init__(self, provider: Optional[str] = None):
         self.provider = provider or settings.LLM_PROVIDER
 
-        import groq
-        self.client = groq.Groq(api_key=settings.GROQ_API_KEY)
+        self.client = _get_client()
         self.model = settings.GROQ_MODEL
 
+        # Serialized BI blobs keyed by id(); the dict itself is kept alongside
+        # so the id cannot be recycled while the entry is alive.
+        self._bi_json_cache = {}
+
     def generate_business_intelligence(
         self,
         domain_name: str,
@@ -67,13 +209,47 @@ class LLMService:
             logger.error(f"Error generating sales training: {str(e)}")
             raise
 
+    def generate_all_trainings(
+        self,
+        domain_name: str,
+        business_intelligence: Dict,
+        training_types: List[str]
+    ) -> Dict[str, Dict]:
+        """
+        Generate several sales training modules with a single LLM call
+
+        Args:
+            domain_name: The domain name
+            business_intelligence: The BI report
+            training_types: Types of training to generate
+
+        Returns:
+            Mapping of training type to training content. Types the LLM did
+            not return are omitted so callers can fall back per type.
+        """
+        prompt = self._build_batch_training_prompt(domain_name, business_intelligence, training_types)
+
+        try:
+            response = self._call_groq(prompt, max_tokens=16000)
+            match = _FENCE_RE.search(response)
+            trainings = orjson.loads(match.group(1) if match else response).get('trainings', {})
+        except Exception as e:
+            logger.error(f"Error generating batched sales training: {str(e)}")
+            raise
+
+        return {
+            training_type: trainings[training_type]
+            for training_type in training_types
+            if isinstance(trainings.get(training_type), dict)
+        }
+
     def _build_prompt(self, domain_name: str, scraped_data: Dict) -> str:
         """Build the prompt for business intelligence generation"""
 
         website_data = scraped_data.get('website_data', {})
         title = website_data.get('title', 'N/A')
         description = website_data.get('description', 'N/A')
-        content = website_data.get('content', 'N/A')[:2000]
+        content = (website_data.get('content') or 'N/A')[:2000]
 
         # Include external data
         external_data = scraped_data.get('external_data', {})
@@ -82,137 +258,102 @@ class LLMService:
         industry_insights = external_data.get('industry_insights', {})
 
         # Include news titles and content summaries
-        news_summary = ""
-        if news:
-            for idx, item in enumerate(news[:5], 1):
-                title = item.get('title', '')
-                content = item.get('content', '')
-                if content and content != "Content not available":
-                    news_summary += f"{idx}. {title}\n   Summary: {content[:200]}...\n\n"
-                else:
-                    news_summary += f"{idx}. {title}\n\n"
-        else:
-            news_summary = "No recent news available"
+        news_parts = []
+        for idx, item in enumerate(news[:5], 1):
+            news_title = item.get('title', '')
+            news_content = item.get('content', '')
+            if news_content and news_content != "Content not available":
+                news_parts.append(f"{idx}. {news_title}\n   Summary: {news_content[:200]}...\n\n")
+            else:
+                news_parts.append(f"{idx}. {news_title}\n\n")
+        news_summary = "".join(news_parts) if news_parts else "No recent news available"
         market_snippets = "\n".join([f"- {snippet}" for snippet in industry_insights.get('market_snippets', [])[:2]]) if industry_insights else "No market insights available"
 
-        prompt = f"""You are a business intelligence and sales strategist AI.
-
-Given the domain: "{domain_name}"
+        prompt = _BI_PROMPT_TEMPLATE.substitute(
+            domain_name=domain_name,
+            title=title,
+            description=description,
+            content=content,
+            news_summary=news_summary,
+            market_snippets=market_snippets,
+            linkedin_url=linkedin.get('company_url', 'Not available'),
+            linkedin_found=linkedin.get('found', False),
+        ) + _BI_SCHEMA_TAIL
 
-Website Information:
-- Title: {title}
-- Description: {description}
-- Content Preview: {content}
+        return prompt
 
-Recent News & Market Context:
-{news_summary}
+    def _build_training_prompt(
+        self,
+        domain_name: str,
+        bi_data: Dict,
+        training_type: str
+    ) -> str:
+        """Build prompt for sales training generation"""
+        bi_json = self._serialize_bi(bi_data)
 
-Industry Market Insights:
-{market_snippets}
+        prompt = f"""You are an expert sales trainer and AI educator.
 
-LinkedIn: {linkedin.get('company_url', 'Not available')} (Found: {linkedin.get('found', False)})
+Based on this business intelligence for "{domain_name}":
+{bi_json}
 
-Generate a comprehensive structured business intelligence report including:
+Create a comprehensive {training_type} training module for sales personnel.
 
-1. Industry overview (2-3 paragraphs)
-2. Market size and growth trends (provide estimates with growth percentages)
-3. Target customer segments (3-5 key segments)
-4. Customer pain points (5-7 main pain points)
-5. Buying behavior (decision-making process, budget cycles, key influencers)
-6. Top competitors and their positioning (3-5 competitors with brief analysis)
-7. Common sales objections (5-7 objections with responses)
-8. Unique selling propositions (3-5 USPs)
-9. Emerging opportunities in next 3-5 years (4-6 opportunities)
-10. Recommended sales strategies (5-7 actionable strategies)
-11. AI-driven automation opportunities (4-6 specific opportunities)
-12. **Sales team challenges** - What challenges do sales people face when selling similar products/services? (5-7 specific challenges)
-13. **Sales upskilling recommendations** - What skills, training, and knowledge do sales teams need to succeed? (5-7 actionable upskilling areas with specific training suggestions)
+The training should include:
+{_TRAINING_OUTLINE}
 
-Output MUST be in valid JSON format following this exact structure:
-{{
-  "industry_overview": "string",
-  "market_size_and_trends": {{
-    "market_size": "string",
-    "growth_rate": "string",
-    "key_trends": "string"
-  }},
-  "target_customer_segments": ["segment1", "segment2", ...],
-  "customer_pain_points": ["pain1", "pain2", ...],
-  "buying_behavior": {{
-    "decision_process": "string",
-    "budget_cycle": "string",
-    "key_influencers": "string"
-  }},
-  "top_competitors": [
-    {{"name": "competitor1", "positioning": "string"}},
-    ...
-  ],
-  "common_objections": [
-    {{"objection": "string", "response": "string"}},
-    ...
-  ],
-  "unique_selling_propositions": ["usp1", "usp2", ...],
-  "emerging_opportunities": ["opportunity1", "opportunity2", ...],
-  "recommended_strategies": ["strategy1", "strategy2", ...],
-  "ai_automation_opportunities": ["opportunity1", "opportunity2", ...],
-  "sales_team_challenges": [
-    {{"challenge": "string", "impact": "string", "frequency": "string"}},
-    ...
-  ],
-  "sales_upskilling_recommendations": [
-    {{"skill_area": "string", "training_type": "string", "priority": "string", "expected_outcome": "string"}},
-    ...
-  ]
-}}
+Return the response as valid JSON with this structure:
+{_TRAINING_SCHEMA}
 
-Return ONLY valid JSON, no additional text."""
+Return ONLY valid JSON."""
 
         return prompt
 
-    def _build_training_prompt(
+    def _build_batch_training_prompt(
         self,
         domain_name: str,
         bi_data: Dict,
-        training_type: str
+        training_types: List[str]
     ) -> str:
-        """Build prompt for sales training generation"""
+        """Build prompt for generating several training modules at once"""
+        bi_json = self._serialize_bi(bi_data)
 
         prompt = f"""You are an expert sales trainer and AI educator.
 
 Based on this business intelligence for "{domain_name}":
-{json.dumps(bi_data, indent=2)}
+{bi_json}
 
-Create a comprehensive {training_type} training module for sales personnel.
+Create a comprehensive training module for sales personnel for EACH of these training types: {", ".join(training_types)}
 
-The training should include:
-1. Learning objectives (3-5 clear objectives)
-2. Key concepts (main ideas salespeople need to understand)
-3. Practical scenarios (2-3 real-world scenarios)
-4. Practice exercises (interactive exercises)
-5. Assessment questions (5-7 questions to test understanding)
-6. Action items (specific steps to implement learning)
+Each training module should include:
+{_TRAINING_OUTLINE}
 
-Return the response as valid JSON with this structure:
+Return the response as valid JSON keyed by training type:
 {{
-  "learning_objectives": ["objective1", ...],
-  "key_concepts": ["concept1", ...],
-  "scenarios": [
-    {{"situation": "string", "approach": "string", "outcome": "string"}},
-    ...
-  ],
-  "exercises": ["exercise1", ...],
-  "assessment": [
-    {{"question": "string", "correct_answer": "string", "explanation": "string"}},
+  "trainings": {{
+    "<training_type>": <training module>,
     ...
-  ],
-  "action_items": ["action1", ...]
+  }}
 }}
 
+where every training module has this structure:
+{_TRAINING_SCHEMA}
+
 Return ONLY valid JSON."""
 
         return prompt
 
-    def _call_groq(self, prompt: str) -> str:
+    def _serialize_bi(self, bi_data: Dict) -> str:
+        """Serialize BI data once per instance (reused across training types)"""
+        cached = self._bi_json_cache.get(id(bi_data))
+        if cached is not None and cached[0] is bi_data:
+            return cached[1]
+
+        # Compact output: indentation only costs prompt tokens
+        bi_json = orjson.dumps(bi_data).decode()
+        self._bi_json_cache[id(bi_data)] = (bi_data, bi_json)
+        return bi_json
+
+    def _call_groq(self, prompt: str, max_tokens: int = 8000) -> str:
         """Call Groq API"""
         response = self.client.chat.completions.create(
             model=self.model,
@@ -221,7 +362,7 @@ Return ONLY valid JSON."""
                 {"role": "user", "content": prompt}
             ],
             temperature=0.7,
-            max_tokens=8000  # Increased for more comprehensive analysis
+            max_tokens=max_tokens  # 8000 by default for comprehensive analysis
         )
         return response.choices[0].message.content.strip()
 
@@ -230,36 +371,16 @@ Return ONLY valid JSON."""
         try:
             # Try to extract JSON from response
             # Sometimes LLMs add markdown code blocks
-            if "```json" in response:
-                response = response.split("```json")[1].split("```")[0].strip()
-            elif "```" in response:
-                response = response.split("```")[1].split("```")[0].strip()
+            match = _FENCE_RE.search(response)
+            if match:
+                response = match.group(1)
 
-            data = json.loads(response)
+            data = orjson.loads(response)
 
             # Validate required fields
-            required_fields = [
-                'industry_overview',
-                'market_size_and_trends',
-                'target_customer_segments',
-                'customer_pain_points',
-                'buying_behavior',
-                'top_competitors',
-                'common_objections',
-                'unique_selling_propositions',
-                'emerging_opportunities',
-                'recommended_strategies',
-                'ai_automation_opportunities',
-                'sales_team_challenges',
-                'sales_upskilling_recommendations'
-            ]
-
-            for field in required_fields:
+            for field, default in _REQUIRED_DEFAULTS.items():
                 if field not in data:
-                    if field in ['industry_overview', 'buying_behavior', 'market_size_and_trends']:
-                        data[field] = "No data available" if field == 'industry_overview' else {}
-                    else:
-                        data[field] = []
+                    data[field] = default.copy() if isinstance(default, (list, dict)) else default
 
             return data
 
@@ -1,5 +1,9 @@
 import logging
 import io
+import functools
+import threading
+import multiprocessing
+from concurrent.futures import Future, ProcessPoolExecutor
 from datetime import datetime
 from typing import Dict, Optional
 from reportlab.lib.pagesizes import letter, A4
@@ -11,6 +15,97 @@ from reportlab.lib.enums import TA_CENTER, TA_LEFT
 
 logger = logging.getLogger(__name__)
 
+_PDF_POOL = None
+_PDF_POOL_LOCK = threading.Lock()
+
+
+def _get_pdf_pool() -> ProcessPoolExecutor:
+    """Return the process pool used for PDF rendering, created on first use"""
+    global _PDF_POOL
+    if _PDF_POOL is None:
+        with _PDF_POOL_LOCK:
+            if _PDF_POOL is None:
+                # 'spawn' starts clean interpreters; forking a threaded Django/Celery
+                # process can copy held locks into the child
+                _PDF_POOL = ProcessPoolExecutor(
+                    max_workers=1,
+                    mp_context=multiprocessing.get_context('spawn')
+                )
+    return _PDF_POOL
+
+
+def _render_pdf(domain_name: str, business_intelligence: Dict, scraped_data: Optional[Dict]) -> bytes:
+    """Render a report to bytes (entry point for pool workers)"""
+    return PDFGenerator(domain_name, business_intelligence, scraped_data).generate().getvalue()
+
+
+def _fmt_bullet(idx: int, item) -> str:
+    """Format a plain list item as a bullet point"""
+    return f"• {item}"
+
+
+def _fmt_key_value(idx: int, pair) -> str:
+    """Format a dict entry as a bold key followed by its value"""
+    key, value = pair
+    return f"<b>{key.replace('_', ' ').title()}:</b> {value}"
+
+
+def _fmt_challenge(idx: int, item) -> str:
+    """Format a sales team challenge with impact and frequency"""
+    if not isinstance(item, dict):
+        return f"• {item}<br/>"
+    return (
+        f"<b>Challenge {idx}:</b> {item.get('challenge', 'N/A')}<br/>"
+        f"<b>Impact:</b> {item.get('impact', 'N/A')}<br/>"
+        f"<b>Frequency:</b> {item.get('frequency', 'N/A')}<br/><br/>"
+    )
+
+
+def _fmt_upskilling(idx: int, item) -> str:
+    """Format a sales upskilling recommendation with details"""
+    if not isinstance(item, dict):
+        return f"• {item}<br/>"
+    return (
+        f"<b>Recommendation {idx}:</b> {item.get('skill_area', 'N/A')}<br/>"
+        f"<b>Training Type:</b> {item.get('training_type', 'N/A')}<br/>"
+        f"<b>Priority:</b> {item.get('priority', 'N/A')}<br/>"
+        f"<b>Expected Outcome:</b> {item.get('expected_outcome', 'N/A')}<br/><br/>"
+    )
+
+
+def _fmt_news(idx: int, item) -> str:
+    """Format a news article with title, source, URL and content summary"""
+    if not isinstance(item, dict):
+        return f"• {item}<br/>"
+
+    title = item.get('title', 'N/A')
+    url = item.get('url', '')
+    published = item.get('published', '')
+    content = item.get('content', '')
+
+    header = (
+        f"<b>{idx}. {title}</b><br/>"
+        f"<b>Source:</b> {item.get('source', 'Unknown')}"
+        f"{' | <b>Published:</b> ' + published if published else ''}<br/>"
+    )
+    if url and url.startswith('http'):
+        header += f"<b>URL:</b> <a href='{url}'>{url[:60]}...</a><br/>"
+
+    # Add article content if available
+    if content and content != "Content not available":
+        return header + f"<b>Summary:</b> {content}<br/><br/>"
+    return header + "<br/>"
+
+
+# kind -> (item formatter, separator, message for empty input)
+_FORMATTERS = {
+    'list': (_fmt_bullet, "<br/>", "No data available"),
+    'dict': (_fmt_key_value, "<br/>", "No data available"),
+    'challenges': (_fmt_challenge, "", "No data available"),
+    'upskilling': (_fmt_upskilling, "", "No data available"),
+    'news': (_fmt_news, "", "No recent news available"),
+}
+
 
 class PDFGenerator:
     """Service for generating PDF reports from business intelligence data"""
@@ -19,40 +114,41 @@ class PDFGenerator:
         self.domain_name = domain_name
         self.bi_data = business_intelligence
         self.scraped_data = scraped_data or {}
-        self.styles = getSampleStyleSheet()
-        self._setup_custom_styles()
-
-    def _setup_custom_styles(self):
-        """Setup custom paragraph styles"""
-        # Only add styles if they don't exist
-        if 'CustomTitle' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='CustomTitle',
-                parent=self.styles['Heading1'],
-                fontSize=24,
-                textColor=colors.HexColor('#2c3e50'),
-                spaceAfter=30,
-                alignment=TA_CENTER,
-            ))
-
-        if 'SectionHeader' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='SectionHeader',
-                parent=self.styles['Heading2'],
-                fontSize=16,
-                textColor=colors.HexColor('#34495e'),
-                spaceAfter=12,
-                spaceBefore=12,
-            ))
-
-        if 'CustomBody' not in self.styles:
-            self.styles.add(ParagraphStyle(
-                name='CustomBody',
-                parent=self.styles['Normal'],
-                fontSize=11,
-                leading=14,
-                spaceAfter=10,
-            ))
+        self.styles = self._get_styles()
+
+    @classmethod
+    @functools.cache
+    def _get_styles(cls):
+        """Build the sample stylesheet plus custom styles once per process"""
+        styles = getSampleStyleSheet()
+
+        styles.add(ParagraphStyle(
+            name='CustomTitle',
+            parent=styles['Heading1'],
+            fontSize=24,
+            textColor=colors.HexColor('#2c3e50'),
+            spaceAfter=30,
+            alignment=TA_CENTER,
+        ))
+
+        styles.add(ParagraphStyle(
+            name='SectionHeader',
+            parent=styles['Heading2'],
+            fontSize=16,
+            textColor=colors.HexColor('#34495e'),
+            spaceAfter=12,
+            spaceBefore=12,
+        ))
+
+        styles.add(ParagraphStyle(
+            name='CustomBody',
+            parent=styles['Normal'],
+            fontSize=11,
+            leading=14,
+            spaceAfter=10,
+        ))
+
+        return styles
 
     def generate(self) -> io.BytesIO:
         """Generate PDF and return as BytesIO object"""
@@ -88,45 +184,45 @@ class PDFGenerator:
                           self.bi_data.get('industry_overview', 'N/A'))
 
         self._add_section(story, "2. Market Size and Growth Trends",
-                          self._format_dict(self.bi_data.get('market_size_and_trends', {})))
+                          self._format(self.bi_data.get('market_size_and_trends', {}), 'dict'))
 
         self._add_section(story, "3. Target Customer Segments",
-                          self._format_list(self.bi_data.get('target_customer_segments', [])))
+                          self._format(self.bi_data.get('target_customer_segments', []), 'list'))
 
         self._add_section(story, "4. Customer Pain Points",
-                          self._format_list(self.bi_data.get('customer_pain_points', [])))
+                          self._format(self.bi_data.get('customer_pain_points', []), 'list'))
 
         self._add_section(story, "5. Buying Behavior",
-                          self._format_dict(self.bi_data.get('buying_behavior', {})))
+                          self._format(self.bi_data.get('buying_behavior', {}), 'dict'))
 
         story.append(PageBreak())
 
         self._add_section(story, "6. Top Competitors",
-                          self._format_list(self.bi_data.get('top_competitors', [])))
+                          self._format(self.bi_data.get('top_competitors', []), 'list'))
 
         self._add_section(story, "7. Common Sales Objections",
-                          self._format_list(self.bi_data.get('common_objections', [])))
+                          self._format(self.bi_data.get('common_objections', []), 'list'))
 
         self._add_section(story, "8. Unique Selling Propositions",
-                          self._format_list(self.bi_data.get('unique_selling_propositions', [])))
+                          self._format(self.bi_data.get('unique_selling_propositions', []), 'list'))
 
         self._add_section(story, "9. Emerging Opportunities (3-5 years)",
-                          self._format_list(self.bi_data.get('emerging_opportunities', [])))
+                          self._format(self.bi_data.get('emerging_opportunities', []), 'list'))
 
         self._add_section(story, "10. Recommended Sales Strategies",
-                          self._format_list(self.bi_data.get('recommended_strategies', [])))
+                          self._format(self.bi_data.get('recommended_strategies', []), 'list'))
 
         self._add_section(story, "11. AI-Driven Automation Opportunities",
-                          self._format_list(self.bi_data.get('ai_automation_opportunities', [])))
+                          self._format(self.bi_data.get('ai_automation_opportunities', []), 'list'))
 
         story.append(PageBreak())
 
         # New Sales Intelligence Sections
         self._add_section(story, "12. Sales Team Challenges",
-                          self._format_challenges(self.bi_data.get('sales_team_challenges', [])))
+                          self._format(self.bi_data.get('sales_team_challenges', []), 'challenges'))
 
         self._add_section(story, "13. Sales Upskilling Recommendations",
-                          self._format_upskilling(self.bi_data.get('sales_upskilling_recommendations', [])))
+                          self._format(self.bi_data.get('sales_upskilling_recommendations', []), 'upskilling'))
 
         # Add external data section if available
         if self.scraped_data:
@@ -137,117 +233,41 @@ class PDFGenerator:
             news_items = external_data.get('news', [])
             if news_items:
                 self._add_section(story, "14. Recent News & Market Updates",
-                                  self._format_news(news_items))
+                                  self._format(news_items, 'news'))
 
         doc.build(story)
         buffer.seek(0)
         return buffer
 
+    def generate_async(self) -> Future:
+        """
+        Render the PDF in a worker process
+
+        Returns a Future resolving to the PDF bytes. Daemonic processes (which
+        cannot start children) render inline and get an already-completed Future.
+        """
+        if multiprocessing.current_process().daemon:
+            future = Future()
+            try:
+                future.set_result(self.generate().getvalue())
+            except Exception as e:
+                future.set_exception(e)
+            return future
+
+        return _get_pdf_pool().submit(_render_pdf, self.domain_name, self.bi_data, self.scraped_data)
+
     def _add_section(self, story: list, title: str, content: str):
         """Add a section to the PDF"""
         story.append(Paragraph(title, self.styles['SectionHeader']))
         story.append(Paragraph(content, self.styles['CustomBody']))
         story.append(Spacer(1, 0.2 * inch))
 
-    def _format_list(self, items: list) -> str:
-        """Format list items as bullet points"""
+    def _format(self, items, kind: str) -> str:
+        """Format a collection for a report section using the formatter registered for kind"""
+        fmt, separator, empty_message = _FORMATTERS[kind]
         if not items:
-            return "No data available"
-
-        formatted = "<br/>".join([f"• {item}" for item in items])
-        return formatted
-
-    def _format_dict(self, data: dict) -> str:
-        """Format dictionary as key-value pairs"""
-        if not data:
-            return "No data available"
-
-        formatted = "<br/>".join([
-            f"<b>{key.replace('_', ' ').title()}:</b> {value}"
-            for key, value in data.items()
-        ])
-        return formatted
-
-    def _format_challenges(self, challenges: list) -> str:
-        """Format sales team challenges with impact and frequency"""
-        if not challenges:
-            return "No data available"
-
-        formatted_items = []
-        for idx, item in enumerate(challenges, 1):
-            if isinstance(item, dict):
-                challenge = item.get('challenge', 'N/A')
-                impact = item.get('impact', 'N/A')
-                frequency = item.get('frequency', 'N/A')
-                formatted_items.append(
-                    f"<b>Challenge {idx}:</b> {challenge}<br/>"
-                    f"<b>Impact:</b> {impact}<br/>"
-                    f"<b>Frequency:</b> {frequency}<br/><br/>"
-                )
-            else:
-                formatted_items.append(f"• {item}<br/>")
-
-        return "".join(formatted_items)
-
-    def _format_upskilling(self, recommendations: list) -> str:
-        """Format sales upskilling recommendations with details"""
-        if not recommendations:
-            return "No data available"
-
-        formatted_items = []
-        for idx, item in enumerate(recommendations, 1):
-            if isinstance(item, dict):
-                skill_area = item.get('skill_area', 'N/A')
-                training_type = item.get('training_type', 'N/A')
-                priority = item.get('priority', 'N/A')
-                expected_outcome = item.get('expected_outcome', 'N/A')
-                formatted_items.append(
-                    f"<b>Recommendation {idx}:</b> {skill_area}<br/>"
-                    f"<b>Training Type:</b> {training_type}<br/>"
-                    f"<b>Priority:</b> {priority}<br/>"
-                    f"<b>Expected Outcome:</b> {expected_outcome}<br/><br/>"
-                )
-            else:
-                formatted_items.append(f"• {item}<br/>")
-
-        return "".join(formatted_items)
-
-    def _format_news(self, news_items: list) -> str:
-        """Format news articles with titles, URLs, sources, and content"""
-        if not news_items:
-            return "No recent news available"
-
-        formatted_items = []
-        for idx, item in enumerate(news_items, 1):
-            if isinstance(item, dict):
-                title = item.get('title', 'N/A')
-                url = item.get('url', '')
-                source = item.get('source', 'Unknown')
-                published = item.get('published', '')
-                content = item.get('content', '')
-
-                # Format article with content
-                if url and url.startswith('http'):
-                    formatted_items.append(
-                        f"<b>{idx}. {title}</b><br/>"
-                        f"<b>Source:</b> {source}"
-                        f"{' | <b>Published:</b> ' + published if published else ''}<br/>"
-                        f"<b>URL:</b> <a href='{url}'>{url[:60]}...</a><br/>"
-                    )
-                else:
-                    formatted_items.append(
-                        f"<b>{idx}. {title}</b><br/>"
-                        f"<b>Source:</b> {source}"
-                        f"{' | <b>Published:</b> ' + published if published else ''}<br/>"
-                    )
-
-                # Add article content if available
-                if content and content != "Content not available":
-                    formatted_items.append(f"<b>Summary:</b> {content}<br/><br/>")
-                else:
-                    formatted_items.append("<br/>")
-
-            else:
-                formatted_items.append(f"• {item}<br/>")
-
-        return "".join(formatted_items)
+            return empty_message
+
+        if kind == 'dict':
+            items = items.items()
+        return separator.join(fmt(idx, item) for idx, item in enumerate(items, 1))
@@ -1,13 +1,93 @@
+import gzip
 import logging
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 import boto3
+from boto3.s3.transfer import TransferConfig
+from botocore.config import Config
 from botocore.exceptions import ClientError
 from django.conf import settings
-from typing import Optional
+from typing import Dict, List, Optional
 import io
-from datetime import datetime
+from datetime import datetime, timedelta
+from urllib.parse import unquote, urlparse
 
 logger = logging.getLogger(__name__)
 
+MB = 1024 * 1024
+
+# Maximum number of keys S3 accepts in a single DeleteObjects request
+DELETE_BATCH_SIZE = 1000
+
+# boto3 clients are thread-safe and expensive to build (credential resolution,
+# endpoint setup, TLS context), so one client per endpoint/region is shared
+_S3_CLIENTS = {}
+_S3_LOCK = threading.Lock()
+
+# Large enough pool that concurrent workers never fall back to fresh TCP/TLS
+# handshakes; adaptive retries back off client-side when S3/R2 throttles
+_S3_CLIENT_CONFIG = Config(
+    max_pool_connections=max(32, 4 * (os.cpu_count() or 1)),
+    retries={'mode': 'adaptive', 'max_attempts': 5},
+    tcp_keepalive=True,
+    connect_timeout=5,
+    read_timeout=60,
+)
+
+# Multipart uploads with concurrent 16 MB parts for anything over 8 MB
+_TRANSFER_CONFIG = TransferConfig(
+    multipart_threshold=8 * MB,
+    multipart_chunksize=16 * MB,
+    max_concurrency=10,
+    max_io_queue=100,
+    use_threads=True,
+)
+
+# (date prefix, epoch second at which it goes stale) for upload keys
+_DATE_PREFIX = ('', 0.0)
+
+
+def _date_prefix() -> str:
+    """Return today's 'YYYY/MM/DD' key prefix, formatting it only once per day"""
+    global _DATE_PREFIX
+    prefix, expires_at = _DATE_PREFIX
+    if time.time() >= expires_at:
+        now = datetime.now()
+        prefix = now.strftime('%Y/%m/%d')
+        midnight = datetime.combine(now.date() + timedelta(days=1), datetime.min.time())
+        _DATE_PREFIX = (prefix, midnight.timestamp())
+    return prefix
+
+
+_UPLOAD_POOL = None
+_UPLOAD_POOL_LOCK = threading.Lock()
+
+
+def _get_upload_pool() -> ThreadPoolExecutor:
+    """Return the thread pool used for background uploads, created on first use"""
+    global _UPLOAD_POOL
+    if _UPLOAD_POOL is None:
+        with _UPLOAD_POOL_LOCK:
+            if _UPLOAD_POOL is None:
+                _UPLOAD_POOL = ThreadPoolExecutor(max_workers=16, thread_name_prefix='s3-upload')
+    return _UPLOAD_POOL
+
+
+def _get_s3_client(client_config: dict):
+    """Return the process-wide S3 client for the given endpoint, region and credentials"""
+    # Keyed by the whole config, so changed or rotated credentials get a new client
+    cache_key = tuple(sorted(client_config.items()))
+    client = _S3_CLIENTS.get(cache_key)
+    if client is None:
+        with _S3_LOCK:
+            client = _S3_CLIENTS.get(cache_key)
+            if client is None:
+                client = boto3.client('s3', config=_S3_CLIENT_CONFIG, **client_config)
+                _S3_CLIENTS[cache_key] = client
+    return client
+
 
 class S3Uploader:
     """Service for uploading files to AWS S3 or Cloudflare R2 (S3-compatible)"""
@@ -29,14 +109,15 @@ class S3Uploader:
             self.storage_type = 's3'
             logger.info("Using AWS S3 storage")
 
-        self.s3_client = boto3.client('s3', **client_config)
+        self.s3_client = _get_s3_client(client_config)
         self.bucket_name = settings.AWS_STORAGE_BUCKET_NAME
 
     def upload_file(
         self,
         file_obj: io.BytesIO,
         file_name: str,
-        content_type: str = 'application/octet-stream'
+        content_type: str = 'application/octet-stream',
+        content_encoding: Optional[str] = None
     ) -> Optional[str]:
         """
         Upload file to S3/R2 and return the URL
@@ -45,35 +126,49 @@ class S3Uploader:
             file_obj: File-like object to upload
             file_name: Name for the file in S3/R2
             content_type: MIME type of the file
+            content_encoding: Content-Encoding of the stored bytes (e.g. 'gzip')
 
         Returns:
             URL of the uploaded file or None if failed
         """
         try:
             # Generate unique file path
-            timestamp = datetime.now().strftime('%Y/%m/%d')
+            timestamp = _date_prefix()
             s3_key = f"domain-intelligence/{timestamp}/{file_name}"
 
             # Extra args for upload
             extra_args = {
                 'ContentType': content_type,
             }
+            if content_encoding:
+                extra_args['ContentEncoding'] = content_encoding
 
             # For AWS S3, add ACL for public read
             # R2 doesn't support ACL in the same way
             if self.storage_type == 's3':
                 extra_args['ACL'] = 'public-read'
 
-            # Upload to S3/R2
-            self.s3_client.upload_fileobj(
-                file_obj,
-                self.bucket_name,
-                s3_key,
-                ExtraArgs=extra_args
-            )
+            # Upload to S3/R2. Buffers below the multipart threshold go up in a
+            # single PutObject read straight from the buffer, skipping the
+            # transfer manager's threads and chunk copies.
+            if self._remaining_size(file_obj) < _TRANSFER_CONFIG.multipart_threshold:
+                self.s3_client.put_object(
+                    Bucket=self.bucket_name,
+                    Key=s3_key,
+                    Body=file_obj,
+                    **extra_args
+                )
+            else:
+                self.s3_client.upload_fileobj(
+                    file_obj,
+                    self.bucket_name,
+                    s3_key,
+                    ExtraArgs=extra_args,
+                    Config=_TRANSFER_CONFIG
+                )
 
             # Generate URL based on storage type
-            url = self._generate_url(s3_key)
+            url = self._generate_url(s3_key, public=extra_args.get('ACL') == 'public-read')
             logger.info(f"Successfully uploaded {file_name} to {self.storage_type.upper()}: {url}")
             return url
 
@@ -84,8 +179,26 @@ class S3Uploader:
             logger.error(f"Unexpected error uploading {file_name}: {str(e)}")
             return None
 
-    def _generate_url(self, s3_key: str) -> str:
-        """Generate presigned URL for uploaded file (valid for 7 days)"""
+    @staticmethod
+    def _remaining_size(file_obj) -> float:
+        """Bytes left to read in a seekable file object (infinity if it can't seek)"""
+        if not (hasattr(file_obj, 'seekable') and file_obj.seekable()):
+            return float('inf')
+        position = file_obj.tell()
+        size = file_obj.seek(0, io.SEEK_END) - position
+        file_obj.seek(position)
+        return size
+
+    def _generate_url(self, s3_key: str, public: bool = False) -> str:
+        """Generate URL for uploaded file (presigned and valid for 7 days unless publicly readable)"""
+        # Public bucket/custom domain or public-read object: the plain URL works, no signing needed
+        if settings.S3_PUBLIC_URL_BASE:
+            return f"{settings.S3_PUBLIC_URL_BASE}/{s3_key}"
+        # 'auto' is R2's placeholder region and has no amazonaws.com host; presign instead
+        region = settings.AWS_S3_REGION_NAME
+        if public and self.storage_type == 's3' and region and region != 'auto':
+            return f"https://{self.bucket_name}.s3.{region}.amazonaws.com/{s3_key}"
+
         try:
             # Generate presigned URL (works for both R2 and S3)
             url = self.s3_client.generate_presigned_url(
@@ -112,9 +225,18 @@ class S3Uploader:
         return self.upload_file(pdf_buffer, file_name, 'application/pdf')
 
     def upload_json(self, json_buffer: io.BytesIO, domain_name: str) -> Optional[str]:
-        """Upload JSON file to S3/R2"""
+        """Upload JSON file to S3/R2, gzip-compressed (clients decompress it transparently)"""
         file_name = f"{domain_name.replace('.', '_')}_data.json"
-        return self.upload_file(json_buffer, file_name, 'application/json')
+        compressed = io.BytesIO(gzip.compress(json_buffer.getvalue(), compresslevel=6))
+        return self.upload_file(compressed, file_name, 'application/json', content_encoding='gzip')
+
+    def upload_pdf_async(self, pdf_buffer: io.BytesIO, domain_name: str) -> Future:
+        """Upload PDF file to S3/R2 in the background; the Future resolves to the URL"""
+        return _get_upload_pool().submit(self.upload_pdf, pdf_buffer, domain_name)
+
+    def upload_json_async(self, json_buffer: io.BytesIO, domain_name: str) -> Future:
+        """Upload JSON file to S3/R2 in the background; the Future resolves to the URL"""
+        return _get_upload_pool().submit(self.upload_json, json_buffer, domain_name)
 
     def generate_presigned_url_from_key(self, s3_key: str, expires_in: int = 604800) -> Optional[str]:
         """
@@ -142,24 +264,68 @@ class S3Uploader:
             logger.error(f"Failed to generate presigned URL for {s3_key}: {str(e)}")
             return None
 
+    def _key_from_url(self, url: str) -> str:
+        """
+        Extract the object key from an S3/R2 file URL
+
+        Handles path-style (endpoint/bucket/key), virtual-hosted (bucket.s3.region/key)
+        and custom-domain URLs; query strings from presigned URLs are ignored.
+        """
+        key = unquote(urlparse(url).path).lstrip('/')
+        if key.startswith(f"{self.bucket_name}/"):
+            key = key[len(self.bucket_name) + 1:]
+        return key
+
     def delete_file(self, url: str) -> bool:
         """Delete file from S3/R2"""
-        try:
-            # Extract key from URL
-            if 'r2.cloudflarestorage.com' in url or self.storage_type == 'r2':
-                # For R2 URL format
-                parts = url.split(f"{self.bucket_name}/")
-                key = parts[-1] if len(parts) > 1 else url.split('/')[-1]
-            else:
-                # For S3 URL format
-                key = url.split(f"{self.bucket_name}.s3.amazonaws.com/")[-1]
+        return self.delete_files([url]).get(url, False)
 
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
-            logger.info(f"Successfully deleted {key} from {self.storage_type.upper()}")
-            return True
-        except ClientError as e:
-            logger.error(f"Failed to delete file from {self.storage_type.upper()}: {str(e)}")
-            return False
-        except Exception as e:
-            logger.error(f"Unexpected error deleting file: {str(e)}")
-            return False
+    def delete_files(self, urls: List[str]) -> Dict[str, bool]:
+        """
+        Delete several files from S3/R2 with batched delete_objects calls
+
+        Args:
+            urls: URLs of the files to delete
+
+        Returns:
+            Mapping of each URL to whether it was deleted
+        """
+        results = {}
+        keys = {}
+        for url in urls:
+            try:
+                keys.setdefault(self._key_from_url(url), []).append(url)
+            except Exception as e:
+                logger.error(f"Could not parse key from {url}: {str(e)}")
+                results[url] = False
+
+        key_list = list(keys)
+        for start in range(0, len(key_list), DELETE_BATCH_SIZE):
+            batch = key_list[start:start + DELETE_BATCH_SIZE]
+            try:
+                response = self.s3_client.delete_objects(
+                    Bucket=self.bucket_name,
+                    Delete={'Objects': [{'Key': key} for key in batch], 'Quiet': True}
+                )
+                # Quiet mode only reports the keys that failed
+                failed = {error['Key'] for error in response.get('Errors', [])}
+                for error in response.get('Errors', []):
+                    logger.error(
+                        f"Failed to delete {error['Key']} from {self.storage_type.upper()}: "
+                        f"{error.get('Message', error.get('Code'))}"
+                    )
+            except ClientError as e:
+                logger.error(f"Failed to delete files from {self.storage_type.upper()}: {str(e)}")
+                failed = set(batch)
+            except Exception as e:
+                logger.error(f"Unexpected error deleting files: {str(e)}")
+                failed = set(batch)
+
+            for key in batch:
+                for url in keys[key]:
+                    results[url] = key not in failed
+            deleted = len(batch) - len(failed)
+            if deleted:
+                logger.info(f"Successfully deleted {deleted} file(s) from {self.storage_type.upper()}")
+
+        return results
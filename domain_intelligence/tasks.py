@@ -1,6 +1,7 @@
 import logging
-import json
 import io
+import orjson
+from concurrent.futures import ThreadPoolExecutor
 from celery import shared_task
 from django.utils import timezone
 from .models import DomainAnalysis, SalesTraining, ScrapingLog
@@ -33,7 +34,8 @@ def process_domain_analysis(self, analysis_id: int):
             url=scraped_data.get('website_data', {}).get('url', ''),
             status_code=scraped_data.get('website_data', {}).get('status_code'),
             success=True,
-            scraped_content_length=len(str(scraped_data))
+            # Serialized size via orjson, a single C pass rather than a Python repr()
+            scraped_content_length=len(orjson.dumps(scraped_data, option=orjson.OPT_NON_STR_KEYS))
         )
 
         analysis.scraped_data = scraped_data
@@ -53,47 +55,41 @@ def process_domain_analysis(self, analysis_id: int):
         analysis.business_intelligence = business_intelligence
         analysis.save()
 
-        # Step 3: Generate and upload PDF
+        # Step 3: Render the PDF in a worker process while the rest of the task runs
         pdf_generator = PDFGenerator(analysis.domain_name, business_intelligence, scraped_data)
-        pdf_buffer = pdf_generator.generate()
+        pdf_render = pdf_generator.generate_async()
 
+        # Step 4: Upload JSON data (serialized while the PDF renders)
         s3_uploader = S3Uploader()
-        pdf_url = s3_uploader.upload_pdf(pdf_buffer, analysis.domain_name)
-
-        if pdf_url:
-            analysis.pdf_url = pdf_url
-
-        # Step 4: Upload JSON data
         json_data = {
             'domain': analysis.domain_name,
             'scraped_data': scraped_data,
             'business_intelligence': business_intelligence,
-            'generated_at': timezone.now().isoformat()
+            'generated_at': timezone.now()
         }
 
-        json_buffer = io.BytesIO(json.dumps(json_data, indent=2).encode('utf-8'))
-        json_url = s3_uploader.upload_json(json_buffer, analysis.domain_name)
-
-        if json_url:
-            analysis.json_url = json_url
+        json_buffer = io.BytesIO(orjson.dumps(json_data, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+        json_upload = s3_uploader.upload_json_async(json_buffer, analysis.domain_name)
 
         # Step 5: Generate sales training modules (with fallback)
         execute_task(generate_sales_training_modules, analysis.id, business_intelligence)
 
-        # Mark as completed
-        analysis.mark_completed()
+        # Upload the PDF once rendered; it overlaps with the JSON upload still in flight
+        pdf_upload = s3_uploader.upload_pdf_async(io.BytesIO(pdf_render.result()), analysis.domain_name)
+
+        # Mark as completed, saving the upload URLs in the same UPDATE
+        DomainAnalysis.finish(analysis.id, pdf_url=pdf_upload.result(), json_url=json_upload.result())
         logger.info(f"Successfully completed analysis for: {analysis.domain_name}")
 
     except Exception as e:
         logger.error(f"Error processing domain analysis {analysis_id}: {str(e)}")
         try:
-            analysis = DomainAnalysis.objects.get(id=analysis_id)
-            analysis.mark_failed(e)
+            DomainAnalysis.finish(analysis_id, error=e)
         except Exception:
             pass
 
-        # Retry the task
-        raise self.retry(exc=e, countdown=60)
+        # Retry the task with exponential backoff (60s, 120s, 240s, capped at 10 minutes)
+        raise self.retry(exc=e, countdown=min(60 * 2 ** self.request.retries, 600))
 
 
 @shared_task
@@ -112,27 +108,53 @@ def generate_sales_training_modules(analysis_id: int, business_intelligence: dic
             ('competitor_analysis', 'Competitor Analysis', 'advanced'),
         ]
 
-        for training_type, title, difficulty in training_types:
-            try:
-                content = llm_service.generate_sales_training(
-                    analysis.domain_name,
-                    business_intelligence,
-                    training_type
-                )
-
-                SalesTraining.objects.create(
-                    domain_analysis=analysis,
-                    title=title,
-                    content=content,
-                    training_type=training_type,
-                    difficulty_level=difficulty,
-                    estimated_duration_minutes=45
-                )
-
-                logger.info(f"Created training module: {title} for {analysis.domain_name}")
-
-            except Exception as e:
-                logger.error(f"Error creating training module {training_type}: {str(e)}")
+        # One LLM call for all types; any type missing from it is generated on its own
+        try:
+            batched = llm_service.generate_all_trainings(
+                analysis.domain_name,
+                business_intelligence,
+                [training_type for training_type, _, _ in training_types]
+            )
+        except Exception as e:
+            logger.warning(f"Batched training generation failed, falling back per type: {str(e)}")
+            batched = {}
+
+        # Types missing from the batched response are independent LLM calls; run them together
+        missing = [training_type for training_type, _, _ in training_types if batched.get(training_type) is None]
+        if missing:
+            with ThreadPoolExecutor(max_workers=len(missing)) as executor:
+                futures = {
+                    training_type: executor.submit(
+                        llm_service.generate_sales_training,
+                        analysis.domain_name,
+                        business_intelligence,
+                        training_type
+                    )
+                    for training_type in missing
+                }
+                for training_type, future in futures.items():
+                    try:
+                        batched[training_type] = future.result()
+                    except Exception as e:
+                        logger.error(f"Error creating training module {training_type}: {str(e)}")
+
+        # All modules are written in a single INSERT
+        modules = [
+            SalesTraining(
+                domain_analysis=analysis,
+                title=title,
+                content=batched[training_type],
+                training_type=training_type,
+                difficulty_level=difficulty,
+                estimated_duration_minutes=45
+            )
+            for training_type, title, difficulty in training_types
+            if batched.get(training_type) is not None
+        ]
+        SalesTraining.objects.bulk_create(modules)
+
+        for module in modules:
+            logger.info(f"Created training module: {module.title} for {analysis.domain_name}")
 
     except Exception as e:
         logger.error(f"Error generating sales training for analysis {analysis_id}: {str(e)}")
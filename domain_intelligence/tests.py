@@ -1,9 +1,14 @@
-from django.test import TestCase
+import gzip
+import requests
+from io import BytesIO
+from bs4 import BeautifulSoup
+from django.core.cache import cache
+from django.test import TestCase, override_settings
 from rest_framework.test import APITestCase
 from rest_framework import status
 from unittest.mock import patch, MagicMock
-from .models import DomainAnalysis, SalesTraining
-from .services import DomainScraper, PDFGenerator, LLMService
+from .models import DomainAnalysis, SalesTraining, ScrapingLog
+from .services import DomainScraper, PDFGenerator, LLMService, S3Uploader
 
 
 class DomainAnalysisModelTest(TestCase):
@@ -21,12 +26,39 @@ class DomainAnalysisModelTest(TestCase):
         self.assertEqual(self.analysis.status, "pending")
         self.assertIsNone(self.analysis.completed_at)
 
+    def test_json_fields_round_trip(self):
+        """Test scraped data and BI survive a save/load cycle"""
+        scraped_data = {'website_data': {'title': 'Café ☕', 'links': ['a', 'b']}, 'count': 3}
+        self.analysis.scraped_data = scraped_data
+        self.analysis.business_intelligence = {'industry_overview': 'Retail'}
+        self.analysis.save()
+
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.scraped_data, scraped_data)
+        self.assertEqual(self.analysis.business_intelligence, {'industry_overview': 'Retail'})
+        self.assertTrue(
+            DomainAnalysis.objects.filter(scraped_data__website_data__title='Café ☕').exists()
+        )
+
     def test_mark_completed(self):
         """Test marking analysis as completed"""
         self.analysis.mark_completed()
         self.assertEqual(self.analysis.status, "completed")
         self.assertIsNotNone(self.analysis.completed_at)
 
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, "completed")
+
+    def test_mark_completed_keeps_file_urls(self):
+        """Test file URLs set before completion are saved with it"""
+        self.analysis.pdf_url = "https://example.com/report.pdf"
+        self.analysis.json_url = "https://example.com/data.json"
+        self.analysis.mark_completed()
+
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.pdf_url, "https://example.com/report.pdf")
+        self.assertEqual(self.analysis.json_url, "https://example.com/data.json")
+
     def test_mark_failed(self):
         """Test marking analysis as failed"""
         error = "Test error"
@@ -35,6 +67,33 @@ class DomainAnalysisModelTest(TestCase):
         self.assertEqual(self.analysis.error_message, error)
         self.assertIsNotNone(self.analysis.completed_at)
 
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, "failed")
+        self.assertEqual(self.analysis.error_message, error)
+
+    def test_finish(self):
+        """Test finishing an analysis by primary key"""
+        DomainAnalysis.finish(self.analysis.pk)
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, "completed")
+        self.assertIsNotNone(self.analysis.completed_at)
+        self.assertIsNone(self.analysis.error_message)
+
+    def test_finish_saves_extra_fields(self):
+        """Test finish writes extra fields such as file URLs in the same update"""
+        DomainAnalysis.finish(self.analysis.pk, pdf_url="https://example.com/report.pdf")
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, "completed")
+        self.assertEqual(self.analysis.pdf_url, "https://example.com/report.pdf")
+
+    def test_finish_with_error(self):
+        """Test finishing an analysis with an error marks it failed"""
+        DomainAnalysis.finish(self.analysis.pk, error=ValueError("boom"))
+        self.analysis.refresh_from_db()
+        self.assertEqual(self.analysis.status, "failed")
+        self.assertEqual(self.analysis.error_message, "boom")
+        self.assertIsNotNone(self.analysis.completed_at)
+
 
 class DomainAnalysisAPITest(APITestCase):
     """Test Domain Analysis API endpoints"""
@@ -72,6 +131,41 @@ class DomainAnalysisAPITest(APITestCase):
         self.assertEqual(response.status_code, status.HTTP_200_OK)
         self.assertEqual(response.data['domain_name'], 'example.com')
 
+    def test_get_analysis_detail_query_count(self):
+        """Test nested modules and logs are prefetched, not loaded per row"""
+        analysis = DomainAnalysis.objects.create(domain_name="example.com")
+        for idx in range(3):
+            SalesTraining.objects.create(
+                domain_analysis=analysis,
+                title=f"Training {idx}",
+                content={'idx': idx},
+                training_type="pitch_strategy"
+            )
+            ScrapingLog.objects.create(domain_analysis=analysis, url=f"https://example.com/{idx}")
+
+        with self.assertNumQueries(3):
+            response = self.client.get(f'/api/analyses/{analysis.id}/')
+
+        self.assertEqual(len(response.data['training_modules']), 3)
+        self.assertEqual(len(response.data['scraping_logs']), 3)
+        self.assertEqual(response.data['training_modules'][0]['content'], {'idx': 2})
+
+    def test_list_analyses(self):
+        """Test listing analyses returns the lightweight fields"""
+        DomainAnalysis.objects.create(domain_name="one.com")
+        DomainAnalysis.objects.create(domain_name="two.com", status="completed")
+
+        response = self.client.get('/api/analyses/')
+
+        self.assertEqual(response.status_code, status.HTTP_200_OK)
+        self.assertEqual(response.data['count'], 2)
+        first = response.data['results'][0]
+        self.assertEqual(first['domain_name'], 'two.com')
+        self.assertEqual(
+            set(first),
+            {'id', 'domain_name', 'status', 'pdf_url', 'created_at', 'completed_at'}
+        )
+
     def test_status_check(self):
         """Test status check endpoint"""
         analysis = DomainAnalysis.objects.create(
@@ -90,7 +184,10 @@ class DomainAnalysisAPITest(APITestCase):
 class DomainScraperTest(TestCase):
     """Test DomainScraper service"""
 
-    @patch('domain_intelligence.services.scraper.requests.get')
+    def setUp(self):
+        cache.clear()
+
+    @patch('domain_intelligence.services.scraper._SESSION.get')
     def test_scrape_website(self, mock_get):
         """Test website scraping"""
         mock_response = MagicMock()
@@ -107,6 +204,9 @@ class DomainScraperTest(TestCase):
                 </body>
             </html>
         """
+        mock_response.content = mock_response.text.encode()
+        mock_response.iter_content.return_value = [mock_response.content]
+        mock_response.headers = {}
         mock_get.return_value = mock_response
 
         scraper = DomainScraper("example.com")
@@ -117,6 +217,247 @@ class DomainScraperTest(TestCase):
         self.assertIn('website_data', data)
         self.assertEqual(data['website_data']['status_code'], 200)
         self.assertEqual(data['website_data']['title'], 'Test Site')
+        self.assertEqual(data['website_data']['description'], 'Test description')
+
+        # The main page is fetched once for both content and metadata
+        page_fetches = [c for c in mock_get.call_args_list if c.args == ('https://example.com',)]
+        self.assertEqual(len(page_fetches), 1)
+        self.assertTrue(page_fetches[0].kwargs['stream'])
+
+        # Re-analysing the domain reuses the cached scrape
+        mock_get.reset_mock()
+        self.assertEqual(DomainScraper("example.com").scrape(), data)
+        mock_get.assert_not_called()
+
+    @patch('domain_intelligence.services.scraper._SESSION.get')
+    def test_failed_scrape_is_not_cached(self, mock_get):
+        """Test a failed scrape is retried instead of served from the cache"""
+        page = MagicMock(status_code=200, headers={})
+        page.iter_content.return_value = [b"<html><head><title>Test Site</title></head></html>"]
+
+        mock_get.side_effect = requests.ConnectionError('unreachable')
+        failed = DomainScraper("example.com").scrape()
+        self.assertIn('error', failed['website_data'])
+
+        mock_get.side_effect = None
+        mock_get.return_value = page
+        data = DomainScraper("example.com").scrape()
+
+        self.assertEqual(data['website_data']['title'], 'Test Site')
+        page_fetches = [c for c in mock_get.call_args_list if c.args == ('https://example.com',)]
+        self.assertEqual(len(page_fetches), 2)
+
+    @patch('domain_intelligence.services.scraper._SESSION.get')
+    def test_unchanged_page_reuses_cached_scrape(self, mock_get):
+        """Test a 304 on re-scrape returns the cached page data without parsing"""
+        page = MagicMock(status_code=200, headers={'ETag': '"v1"'})
+        page.iter_content.return_value = [b"<html><head><title>Cached Site</title></head></html>"]
+        not_modified = MagicMock(status_code=304, headers={})
+        not_modified.iter_content.return_value = []
+
+        mock_get.return_value = page
+        DomainScraper("example.com")._scrape_page()
+
+        mock_get.return_value = not_modified
+        website_data, _ = DomainScraper("example.com")._scrape_page()
+
+        self.assertEqual(website_data['title'], 'Cached Site')
+        self.assertEqual(mock_get.call_args.kwargs['headers']['If-None-Match'], '"v1"')
+
+    @patch.dict('domain_intelligence.services.scraper._FIRECRAWL_APPS', clear=True)
+    @patch('firecrawl.FirecrawlApp')
+    def test_firecrawl_client_is_shared(self, mock_app):
+        """Test the Firecrawl client is created once per API key"""
+        from domain_intelligence.services.scraper import _get_firecrawl_app
+
+        first = _get_firecrawl_app('key')
+        second = _get_firecrawl_app('key')
+
+        self.assertIs(first, second)
+        mock_app.assert_called_once_with(api_key='key')
+
+    def test_clean_text_fixes_mojibake_and_strips_markup(self):
+        """Test _clean_text repairs mis-decoded UTF-8 and drops scripts, styles, tags and comments"""
+        clean = DomainScraper("example.com")._clean_text
+
+        self.assertEqual(clean('Itâ€™s â€œnewâ€\x9d'), 'It\'s "new"\x9d')
+        self.assertEqual(clean('CafÃ© menu'), 'Café menu')
+        self.assertEqual(clean('<script>alert(1)</script><p>Hello <b>world</b></p><!-- note -->'), 'Hello world')
+        self.assertEqual(clean('<style>p{}</style>Text'), 'Text')
+
+    def test_clean_text_runs_only_the_passes_it_needs(self):
+        """Test text with only markup, or only mojibake, is cleaned the same as before the gates"""
+        clean = DomainScraper("example.com")._clean_text
+
+        self.assertEqual(clean('Price 5 < 6 and CafÃ©'), 'Price 5 < 6 and Café')
+        self.assertEqual(clean('No markup here, just â€™ quote'), "No markup here, just ' quote")
+        self.assertEqual(clean('a <b>bold</b> move'), 'a bold move')
+
+    def test_clean_text_decodes_nested_entities(self):
+        """Test entities are decoded for up to three rounds, and text without '&' is left alone"""
+        clean = DomainScraper("example.com")._clean_text
+
+        self.assertEqual(clean('Tom &amp; Jerry'), 'Tom & Jerry')
+        self.assertEqual(clean('&amp;amp;lt;i&amp;amp;gt;'), '')
+        self.assertEqual(clean('&amp;amp;amp;amp;'), '&amp;')
+        self.assertEqual(clean('R&D team'), 'R&D team')
+
+    def test_clean_text_plain_text_fast_path(self):
+        """Test single-spaced ASCII is only stripped, while other whitespace is still collapsed"""
+        clean = DomainScraper("example.com")._clean_text
+
+        self.assertEqual(clean('  Acme Inc  '), 'Acme Inc')
+        self.assertEqual(clean('Acme  Inc'), 'Acme Inc')
+        self.assertEqual(clean('Acme\tInc'), 'Acme Inc')
+        self.assertEqual(clean('x\x0by'), 'x y')
+
+    def test_extract_content_normalizes_whitespace(self):
+        """Test page text keeps inline runs joined and collapses every whitespace run to one space"""
+        soup = BeautifulSoup(
+            '<html><head><title>T</title><style>p{}</style></head><body><header>Top</header><nav>Menu</nav>\n'
+            '<h1>Acme   Corp</h1>\n<p>We build <b>sales</b><i>tools</i>.\n   Line two\tafter a tab.</p>'
+            '<script>var a;</script><footer>Foot</footer></body></html>',
+            'lxml'
+        )
+
+        self.assertEqual(
+            DomainScraper("example.com")._extract_content(soup),
+            'T Acme Corp We build salestools. Line two after a tab.'
+        )
+
+    def test_extract_links_keeps_same_host_links(self):
+        """Test root-relative and same-host links are kept once, in page order, and other hosts are dropped"""
+        soup = BeautifulSoup(
+            '<a href="/about">A</a><a href="/about">Again</a><a href="//evil.com/x">E</a>'
+            '<a href="https://other.com/p">O</a><a href="https://example.com/team">T</a>'
+            '<a href="contact">C</a><a href="#top">H</a><a href="mailto:a@example.com">M</a><a>No href</a>',
+            'lxml'
+        )
+
+        self.assertEqual(
+            DomainScraper("example.com")._extract_links(soup, 'https://example.com'),
+            ['https://example.com/about', 'https://example.com/team', 'https://example.com/contact', 'https://example.com#top']
+        )
+
+    def test_clean_text_collapses_whitespace_and_drops_invisible_characters(self):
+        """Test line breaks and tabs collapse to one space, while zero-width and bidi marks are removed"""
+        clean = DomainScraper("example.com")._clean_text
+
+        self.assertEqual(clean('a\r\n\tb'), 'a b')
+        self.assertEqual(clean('line1\nline2  '), 'line1 line2')
+        self.assertEqual(clean('a\xa0b'), 'a b')
+        self.assertEqual(clean('foo\u200bbar'), 'foobar')
+        self.assertEqual(clean('\u202aRTL\u202c text'), 'RTL text')
+
+    def _scrape_article(self, page):
+        """Run _scrape_article_content on an HTML page served by a mocked fetch"""
+        response = MagicMock(status_code=200, headers={}, encoding='utf-8', url='https://news.example.com/a')
+        response.iter_content.return_value = [page.encode()]
+        with patch('domain_intelligence.services.scraper._SESSION.get', return_value=response):
+            return DomainScraper("example.com")._scrape_article_content('https://news.example.com/a')
+
+    def test_article_content_extraction(self):
+        """Test article text matches the original BeautifulSoup extraction"""
+        article = (
+            '<html><head><script>var x=1;</script></head><body><nav>Home | News</nav>'
+            '<article><h1>Acme raises funds</h1><p>Acme Corp <b>announced</b> today that it has raised a new '
+            'round of funding to expand its sales platform across Europe and Asia.</p><aside>Related stories</aside>'
+            '<p>The company said the money will go toward hiring and product work over the next two years.</p>'
+            '</article><footer>Copyright</footer></body></html>'
+        )
+        paragraphs = (
+            '<html><body><div><p>Short one.</p>'
+            '<p>Analysts expect the deal to close in the third quarter of next year.</p>'
+            '<p>Regulators in two countries still have to approve the acquisition.</p><p>Ok</p></div></body></html>'
+        )
+
+        self.assertEqual(
+            self._scrape_article(article),
+            'Acme raises funds Acme Corp announced today that it has raised a new round of funding to expand '
+            'its sales platform across Europe and Asia. The company said the money will go toward hiring and '
+            'product work over the next two years.'
+        )
+        self.assertEqual(
+            self._scrape_article(paragraphs),
+            'Analysts expect the deal to close in the third quarter of next year. '
+            'Regulators in two countries still have to approve the acquisition.'
+        )
+
+    def test_article_class_patterns_keep_priority_order(self):
+        """Test class matching is case-insensitive and prefers earlier patterns over document order"""
+        page = (
+            '<html><body><div class="sidebar">Short sidebar text</div>'
+            '<div class="post-content"><p>This post content block is long enough to qualify on its own, '
+            'but posts rank below stories in the pattern order.</p></div>'
+            '<div class="Main-Story"><p>Acme Corp <b>announced</b> today that it has raised a new round of '
+            'funding to expand its sales platform across Europe and Asia.</p>'
+            '<p>Shares <em>rose</em> 4% on the news.</p></div></body></html>'
+        )
+
+        self.assertEqual(
+            self._scrape_article(page),
+            'Acme Corp announced today that it has raised a new round of funding to expand its sales '
+            'platform across Europe and Asia. Shares rose 4% on the news.'
+        )
+
+    def test_article_comments_are_dropped_at_parse_time(self):
+        """Test HTML comments never reach article text, and text split only by a comment is read as one run"""
+        page = (
+            '<html><body><article><p>Acme<!-- ad slot -->Corp <!-- tracking -->announced today that it has '
+            'raised a new round of funding to expand its sales platform across Europe and Asia.</p>'
+            '</article></body></html>'
+        )
+
+        self.assertEqual(
+            self._scrape_article(page),
+            'AcmeCorp announced today that it has raised a new round of funding to expand its sales '
+            'platform across Europe and Asia.'
+        )
+
+    def test_article_parser_is_per_thread(self):
+        """Test each thread parses articles with its own lxml parser"""
+        from concurrent.futures import ThreadPoolExecutor
+        from .services.scraper import _article_parser
+
+        with ThreadPoolExecutor(max_workers=1) as executor:
+            other = executor.submit(_article_parser).result()
+
+        self.assertIs(_article_parser(), _article_parser())
+        self.assertIsNot(_article_parser(), other)
+
+    @patch('domain_intelligence.services.scraper._get_firecrawl_app')
+    def test_failed_firecrawl_scrape_cancels_pending_crawl(self, mock_get_app):
+        """Test falling back to BeautifulSoup cancels the background crawl"""
+        crawl_future = MagicMock()
+        executor = MagicMock()
+        executor.submit.return_value = crawl_future
+        scraper = DomainScraper("example.com")
+
+        with patch('domain_intelligence.services.scraper.ThreadPoolExecutor', return_value=executor), \
+                patch.object(scraper, '_firecrawl_scrape', side_effect=RuntimeError('scrape failed')), \
+                patch.object(scraper, '_scrape_with_beautifulsoup', return_value={'domain': 'example.com'}):
+            self.assertEqual(scraper._scrape_with_firecrawl(), {'domain': 'example.com'})
+
+        crawl_future.cancel.assert_called_once()
+
+    @patch.dict('domain_intelligence.services.scraper._FIRECRAWL_V4_METHODS', clear=True)
+    def test_firecrawl_call_style_follows_sdk_signature(self):
+        """Test the v4 or params-dict call is chosen from the SDK signature, not from errors"""
+        class V4App:
+            def scrape(self, url, *, formats=None):
+                return ('v4', formats)
+
+        class LegacyApp:
+            def scrape_url(self, url, params=None):
+                return ('legacy', params['formats'])
+
+            def scrape(self, url, params=None):
+                raise AssertionError('scrape_url should be used')
+
+        scraper = DomainScraper("example.com")
+
+        self.assertEqual(scraper._firecrawl_scrape(V4App(), 'https://example.com'), ('v4', ['markdown', 'html']))
+        self.assertEqual(scraper._firecrawl_scrape(LegacyApp(), 'https://example.com'), ('legacy', ['markdown', 'html']))
 
 
 class PDFGeneratorTest(TestCase):
@@ -146,6 +487,194 @@ class PDFGeneratorTest(TestCase):
         pdf_buffer.seek(0)
         self.assertTrue(pdf_buffer.read(4) == b'%PDF')
 
+    def test_dict_in_list_section_lists_keys(self):
+        """Test a dict given to a list section is bulleted by key, as before"""
+        generator = PDFGenerator('example.com', {})
+
+        self.assertEqual(generator._format({'crm': 1, 'email': 2}, 'list'), "• crm<br/>• email")
+        self.assertEqual(generator._format({'team_size': 5}, 'dict'), "<b>Team Size:</b> 5")
+
+    def test_pdf_generation_async(self):
+        """Test PDF generation in a spawned worker process"""
+        generator = PDFGenerator('example.com', {'industry_overview': 'Test overview'})
+        pdf_bytes = generator.generate_async().result(timeout=60)
+
+        self.assertTrue(pdf_bytes.startswith(b'%PDF'))
+
+
+class S3ClientCacheTest(TestCase):
+    """Test the shared S3 client cache"""
+
+    def test_s3_client_is_rebuilt_for_new_credentials(self):
+        """Test clients are shared per config, and changed credentials get a new client"""
+        from domain_intelligence.services.s3_uploader import _get_s3_client
+
+        config = {'aws_access_key_id': 'old', 'aws_secret_access_key': 'secret', 'region_name': 'auto'}
+        with patch.dict('domain_intelligence.services.s3_uploader._S3_CLIENTS', clear=True), \
+                patch('domain_intelligence.services.s3_uploader.boto3.client', side_effect=lambda *a, **kw: MagicMock()):
+            first = _get_s3_client(config)
+            self.assertIs(_get_s3_client(dict(config)), first)
+            self.assertIsNot(_get_s3_client({**config, 'aws_access_key_id': 'new'}), first)
+
+
+class S3UploaderTest(TestCase):
+    """Test S3Uploader service"""
+
+    def setUp(self):
+        patcher = patch('domain_intelligence.services.s3_uploader._get_s3_client')
+        self.client = patcher.start().return_value
+        self.addCleanup(patcher.stop)
+        self.uploader = S3Uploader()
+        self.uploader.bucket_name = 'reports'
+
+    def test_upload_pdf_async(self):
+        """Test background uploads resolve to the uploaded file URL"""
+        self.uploader.storage_type = 'r2'
+        self.client.generate_presigned_url.return_value = 'https://files/report.pdf'
+
+        future = self.uploader.upload_pdf_async(BytesIO(b'%PDF'), 'example.com')
+
+        self.assertEqual(future.result(timeout=5), 'https://files/report.pdf')
+        key = self.client.put_object.call_args.kwargs['Key']
+        self.assertTrue(key.endswith('/example_com_report.pdf'))
+        self.assertEqual(self.client.put_object.call_args.kwargs['ContentType'], 'application/pdf')
+        self.client.upload_fileobj.assert_not_called()
+
+    def test_upload_json_is_gzipped(self):
+        """Test JSON uploads are stored gzip-encoded"""
+        payload = b'{"domain": "example.com"}'
+
+        self.uploader.upload_json(BytesIO(payload), 'example.com')
+
+        kwargs = self.client.put_object.call_args.kwargs
+        self.assertEqual(kwargs['ContentType'], 'application/json')
+        self.assertEqual(kwargs['ContentEncoding'], 'gzip')
+        self.assertEqual(gzip.decompress(kwargs['Body'].getvalue()), payload)
+
+    @override_settings(S3_PUBLIC_URL_BASE='https://cdn.example.com')
+    def test_public_url_base_skips_signing(self):
+        """Test uploads return plain URLs when a public base URL is configured"""
+        url = self.uploader.upload_pdf(BytesIO(b'%PDF'), 'example.com')
+
+        self.assertTrue(url.startswith('https://cdn.example.com/domain-intelligence/'))
+        self.assertTrue(url.endswith('/example_com_report.pdf'))
+        self.client.generate_presigned_url.assert_not_called()
+
+    @override_settings(S3_PUBLIC_URL_BASE='', AWS_S3_REGION_NAME='auto')
+    def test_public_url_with_auto_region_is_presigned(self):
+        """Test the 'auto' region never yields an amazonaws.com URL"""
+        self.uploader.storage_type = 's3'
+        self.client.generate_presigned_url.return_value = 'https://signed'
+
+        self.assertEqual(self.uploader._generate_url('reports/a.pdf', public=True), 'https://signed')
+
+    def test_key_from_url(self):
+        """Test object keys are parsed from path-style, virtual-hosted and presigned URLs"""
+        bucket = self.uploader.bucket_name
+        key = 'domain-intelligence/2024/01/02/example_com_report.pdf'
+        urls = [
+            f"https://account.r2.cloudflarestorage.com/{bucket}/{key}?X-Amz-Signature=abc",
+            f"https://{bucket}.s3.us-west-2.amazonaws.com/{key}",
+            f"https://cdn.example.com/{key}",
+        ]
+        for url in urls:
+            self.assertEqual(self.uploader._key_from_url(url), key)
+
+    def test_delete_files_batches_keys(self):
+        """Test deletes are sent in batches of 1000 keys and failures reported per URL"""
+        self.uploader.storage_type = 'r2'
+        bucket = self.uploader.bucket_name
+        urls = [f"https://r2.example.com/{bucket}/reports/{i}.pdf" for i in range(1001)]
+        self.client.delete_objects.side_effect = [
+            {'Errors': [{'Key': 'reports/3.pdf', 'Code': 'AccessDenied'}]},
+            {},
+        ]
+
+        results = self.uploader.delete_files(urls)
+
+        self.assertEqual(self.client.delete_objects.call_count, 2)
+        first_batch = self.client.delete_objects.call_args_list[0].kwargs['Delete']['Objects']
+        self.assertEqual(len(first_batch), 1000)
+        self.assertFalse(results[urls[3]])
+        self.assertEqual(sum(results.values()), 1000)
+
+
+class LLMServiceTest(TestCase):
+    """Test LLMService response handling"""
+
+    def setUp(self):
+        with patch('domain_intelligence.services.llm_service._get_client'):
+            self.service = LLMService()
+
+    def test_parse_response_strips_code_fence(self):
+        """Test JSON wrapped in a markdown code block is parsed"""
+        data = self.service._parse_response('Report:\n```json\n{"industry_overview": "Retail"}\n```')
+
+        self.assertEqual(data['industry_overview'], 'Retail')
+        self.assertEqual(data['buying_behavior'], {})
+        self.assertEqual(data['top_competitors'], [])
+
+    def test_build_prompt_keeps_website_fields(self):
+        """Test news items do not overwrite the website title and content"""
+        scraped_data = {
+            'website_data': {'title': 'Site Title', 'content': 'Site content'},
+            'external_data': {'news': [{'title': 'News Title', 'content': 'News body'}]},
+        }
+
+        prompt = self.service._build_prompt('example.com', scraped_data)
+
+        self.assertIn('- Title: Site Title', prompt)
+        self.assertIn('- Content Preview: Site content', prompt)
+        self.assertIn('1. News Title\n   Summary: News body...', prompt)
+
+    def test_generate_all_trainings(self):
+        """Test batched training generation keeps only requested, well-formed types"""
+        response = '{"trainings": {"pitch_strategy": {"key_concepts": ["Value"]}, "product_knowledge": "oops", "extra": {}}}'
+
+        with patch.object(self.service, '_call_groq', return_value=response) as mock_call:
+            trainings = self.service.generate_all_trainings(
+                'example.com', {}, ['pitch_strategy', 'product_knowledge']
+            )
+
+        mock_call.assert_called_once()
+        self.assertEqual(trainings, {'pitch_strategy': {'key_concepts': ['Value']}})
+
+    def test_parse_response_invalid_json(self):
+        """Test invalid JSON raises ValueError"""
+        with self.assertRaises(ValueError):
+            self.service._parse_response('not json')
+
+
+class GenerateSalesTrainingTaskTest(TestCase):
+    """Test generate_sales_training_modules task"""
+
+    def setUp(self):
+        self.analysis = DomainAnalysis.objects.create(domain_name="example.com")
+
+    @patch('domain_intelligence.tasks.LLMService')
+    def test_falls_back_for_missing_types(self, mock_service_class):
+        """Test types missing from the batched response are generated individually"""
+        from .tasks import generate_sales_training_modules
+
+        service = mock_service_class.return_value
+        service.generate_all_trainings.return_value = {
+            'objection_handling': {'key_concepts': ['a']},
+            'product_knowledge': {'key_concepts': ['b']},
+            'pitch_strategy': {'key_concepts': ['c']},
+        }
+        service.generate_sales_training.return_value = {'key_concepts': ['d']}
+
+        generate_sales_training_modules(self.analysis.id, {'industry_overview': 'x'})
+
+        service.generate_sales_training.assert_called_once_with(
+            'example.com', {'industry_overview': 'x'}, 'competitor_analysis'
+        )
+        self.assertEqual(self.analysis.training_modules.count(), 4)
+        self.assertEqual(
+            self.analysis.training_modules.get(training_type='competitor_analysis').content,
+            {'key_concepts': ['d']}
+        )
+
 
 class SalesTrainingTest(TestCase):
     """Test SalesTraining model"""
@@ -9,6 +9,7 @@ from .serializers import (
     DomainAnalysisListSerializer,
     DomainAnalysisRequestSerializer,
     SalesTrainingSerializer,
+    serialize_domain_list,
 )
 from .tasks import process_domain_analysis
 from .utils import execute_task
@@ -29,12 +30,34 @@ class DomainAnalysisViewSet(viewsets.ReadOnlyModelViewSet):
     queryset = DomainAnalysis.objects.all()
     serializer_class = DomainAnalysisSerializer
 
+    # Detail actions that only read scalar columns of the analysis
+    LIGHT_ACTIONS = ('download_pdf', 'download_json', 'training_modules', 'status_check')
+
+    def get_queryset(self):
+        """Prefetch nested relations for the detail view; skip the JSON blobs where unused"""
+        queryset = super().get_queryset()
+        if self.action == 'retrieve':
+            queryset = DomainAnalysisSerializer.setup_eager_loading(queryset)
+        elif self.action in self.LIGHT_ACTIONS:
+            queryset = queryset.defer('scraped_data', 'business_intelligence')
+        return queryset
+
     def get_serializer_class(self):
         """Use different serializer for list view"""
         if self.action == 'list':
             return DomainAnalysisListSerializer
         return DomainAnalysisSerializer
 
+    def list(self, request, *args, **kwargs):
+        """List analyses as plain dicts, bypassing per-row serializer instances"""
+        rows = serialize_domain_list(self.filter_queryset(self.get_queryset()))
+
+        page = self.paginate_queryset(rows)
+        if page is not None:
+            return self.get_paginated_response(page)
+
+        return Response(list(rows))
+
     @action(detail=False, methods=['post'])
     def create_analysis(self, request):
         """
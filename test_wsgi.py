@@ -5,16 +5,17 @@ import sys
 
 os.environ.setdefault('DJANGO_SETTINGS_MODULE', 'config.settings')
 
-print("Testing WSGI application load...")
-print(f"Python path: {sys.path}")
-print(f"Working directory: {os.getcwd()}")
+# Set DEBUG_PATH=1 to show where the application is being imported from
+if os.getenv('DEBUG_PATH'):
+    sys.stderr.write(f"Python path: {sys.path}\nWorking directory: {os.getcwd()}\n")
 
 try:
     from config.wsgi import application
-    print("✅ SUCCESS: WSGI application loaded successfully")
-    print(f"Application type: {type(application)}")
+    print(f"✅ SUCCESS: WSGI application loaded successfully ({type(application).__name__})")
 except Exception as e:
     print(f"❌ FAILED: {e}")
+    print(f"Python path: {sys.path}")
+    print(f"Working directory: {os.getcwd()}")
     import traceback
     traceback.print_exc()
     sys.exit(1)